@@ -15,14 +15,211 @@ configuration. All such data must be passed as parameters at runtime.
 """
 
 import re
-from typing import Optional, Dict, Any
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 from email.utils import parseaddr
 
 # Gmail HTML template - simple wrapper with sans-serif font
 GMAIL_HTML_TEMPLATE = '<div style="font-family: sans-serif;">{content}</div>'
+_TEMPLATE_PREFIX, _TEMPLATE_SUFFIX = GMAIL_HTML_TEMPLATE.split("{content}")
+
+# Existing forward subject prefixes, compared against the lowercased head
+_FWD_PREFIXES = ("fwd:", "fw:")
+
+# Entities that must be escaped when embedding plain text in HTML, in the
+# order they are applied ("&" first so produced entities aren't re-escaped)
+_HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"))
+
+# Static fragments of the HTML quote block built by format_quoted_body
+_QUOTE_HTML_PREFIX = (
+    '<br><br>\n'
+    '<div style="border-left: 2px solid #ccc; padding-left: 10px; margin-left: 5px; color: #555;">\n'
+    '<p style="margin: 0 0 10px 0;">On '
+)
+_QUOTE_HTML_MID = '&gt; wrote:</p>\n<div>'
+_QUOTE_HTML_SUFFIX = '</div>\n</div>'
+
+# Static fragments of the HTML forward header built by format_forward_body
+_FORWARD_HTML_FROM = '<br><br>\n---------- Forwarded message ----------<br>\n<b>From:</b> '
+_FORWARD_HTML_DATE = '&gt;<br>\n<b>Date:</b> '
+_FORWARD_HTML_SUBJECT = '<br>\n<b>Subject:</b> '
+_FORWARD_HTML_TO = '<br>\n<b>To:</b> '
+_FORWARD_HTML_END = '<br>\n<br>\n'
+
+# Characters that mean an address string needs full parseaddr handling
+_ADDR_NEEDS_PARSE = re.compile(r'[\s<>"(),;:\\\[\]]')
+_ADDR_NAME_NEEDS_PARSE = re.compile(r'[<>"(),;:\\\[\]@.]')
+_ADDR_PLAIN = re.compile(r'[^\s<>"(),;:\\\[\]@]+@[^\s<>"(),;:\\\[\]@]+')
+
+# One comma-separated entry of an address list. Commas inside a quoted display
+# name ("Doe, John" <john@example.com>) don't split; an unterminated quote
+# falls back to plain characters. [^"]* is nested inside the outer +, but
+# matching stays linear: nothing follows the group, so a match never has to
+# backtrack into it, and a quoted run only fails when no quote is left in
+# the rest of the string, so that failed scan happens at most once.
+_ADDR_TOKEN = re.compile(r'(?:"[^"]*"|[^,])+')
+
+# Escaped (literal backslash-n) or real newline
+_NL_RE = re.compile(r"\\n|\n")
+
+# Existing HTML structure that wrap_with_gmail_template must not re-wrap
+_RE_HTML_STRUCT = re.compile(r'<html|<body|<div\s+style', re.IGNORECASE)
+
+# A line and its newline plus the next line's leading blanks, peeking at the
+# first non-blank char of the next line
+_RE_LINE_BREAK = re.compile(r'([^\n]*)\n([^\S\n]*)(?=([^\n]?))')
+
+# Line-shape checks used by remove_artificial_line_breaks
+_RE_ENDS_WORD = re.compile(r'\w$')
+_RE_ENDS_SENT = re.compile(r'[.?!:;]$')
+_RE_NEXT_LOWER = re.compile(r'[a-zäöü]')
+
+# German articles, prepositions, conjunctions that typically precede nouns
+# Note: Avoid single-letter words (a, I) as they cause false positives (e.g., "Option A")
+_RE_CONNECTOR = re.compile(
+    r'\b(mit|und|oder|der|die|das|den|dem|des|ein|eine|einem|einer|eines|'
+    r'zu|von|für|bei|nach|über|unter|durch|ohne|gegen|bis|seit|als|wie|'
+    r'auf|aus|vor|hinter|neben|zwischen|an|in|im|am|zum|zur|vom|beim|'
+    r'the|of|to|for|on|with|at|by|from|into|onto)\s*$',
+    re.IGNORECASE
+)
+
+# German adjective endings (precede nouns) - require 5+ chars before ending to avoid false positives like "Option"
+_RE_ADJECTIVE = re.compile(r'\b\w{5,}(en|er|es|em)\s*$', re.IGNORECASE)
+
+
+# Header names (lowercase) read by extract_threading_info / extract_recipients.
+# Interned so canonical-name lookups below return the very same objects and
+# set/dict key comparisons resolve on identity.
+_THREADING_HEADERS = frozenset(map(sys.intern, ("message-id", "subject", "from", "references", "date")))
+_RECIPIENT_HEADERS = frozenset(map(sys.intern, ("to", "cc")))
+_THREADING_AND_RECIPIENT_HEADERS = _THREADING_HEADERS | _RECIPIENT_HEADERS
+
+# Canonical spellings Gmail returns for the headers above, mapped to their
+# lowercase form so the common case needs no str.lower() allocation
+_CANONICAL_HEADER_NAMES = {
+    name: sys.intern(name.lower())
+    for name in (
+        "Message-ID", "Message-Id", "Subject", "From", "References",
+        "Date", "To", "Cc", "CC",
+    )
+}
+
+
+@dataclass(slots=True)
+class ThreadingInfo:
+    """Threading fields of a Gmail message, as returned by extract_threading_info."""
+
+    thread_id: str = ""
+    message_id: str = ""
+    subject: str = ""
+    from_email: str = ""
+    from_name: str = ""
+    references: str = ""
+    date: str = ""
+
+
+@dataclass(slots=True)
+class Recipients:
+    """Recipient headers of a Gmail message, as returned by extract_recipients."""
+
+    to: str = ""
+    cc: str = ""
+
+
+def _scan_headers(headers: List[Dict[str, Any]], wanted: frozenset) -> Dict[str, str]:
+    """
+    Walk a header list once, stopping when every wanted header is found.
+
+    If a header occurs more than once the first occurrence wins, which is
+    what lets the scan stop early.
+    """
+    result: Dict[str, str] = {}
+    if not wanted:
+        return result
+
+    max_len = max(len(name) for name in wanted)
+    remaining = len(wanted)
+    # Bind lookups locally; this loop runs once per header of every message
+    canonical_get = _CANONICAL_HEADER_NAMES.get
+    for header in headers:
+        name = header.get("name", "")
+        # Cheap length prefilter avoids lowercasing headers we can't want
+        if len(name) > max_len:
+            continue
+        name = canonical_get(name) or name.lower()
+        if name in wanted and name not in result:
+            result[name] = header.get("value", "")
+            remaining -= 1
+            if not remaining:
+                break
+
+    return result
 
 
-def extract_threading_info(message: Dict[str, Any]) -> Dict[str, str]:
+def extract_headers(message: Dict[str, Any], wanted: frozenset) -> Dict[str, str]:
+    """
+    Extract selected headers from a Gmail message in a single pass.
+
+    Walks the header list once and stops as soon as every wanted header
+    has been found, so callers needing several fields should pass them
+    all in one call rather than scanning the headers repeatedly.
+
+    A header that occurs more than once yields its first value. RFC 5322
+    allows each header these helpers read (Message-ID, Subject, From,
+    References, Date, To, Cc) at most once, so this only matters for
+    malformed messages. gmail_tools._extract_headers, used for display,
+    still keeps the last value.
+
+    Args:
+        message: Gmail API message response
+        wanted: Lowercase header names to extract
+
+    Returns:
+        Dict mapping each found lowercase header name to its value.
+        Headers that are not present are omitted.
+
+    Example:
+        >>> extract_headers(
+        ...     {"payload": {"headers": [{"name": "Subject", "value": "Hi"}]}},
+        ...     frozenset({"subject", "to"}),
+        ... )
+        {'subject': 'Hi'}
+    """
+    headers = message.get("payload", {}).get("headers", [])
+    return _scan_headers(headers, wanted)
+
+
+def _threading_info_from_headers(
+    message: Dict[str, Any],
+    headers: Dict[str, str]
+) -> ThreadingInfo:
+    """Build ThreadingInfo from headers returned by extract_headers."""
+    # Parse "Display Name <email@example.com>" format
+    from_name, from_email = parseaddr(headers["from"]) if "from" in headers else ("", "")
+
+    return ThreadingInfo(
+        thread_id=message.get("threadId", ""),
+        message_id=headers.get("message-id", ""),
+        subject=headers.get("subject", ""),
+        from_email=from_email,
+        from_name=from_name,
+        references=headers.get("references", ""),
+        date=headers.get("date", ""),
+    )
+
+
+def _recipients_from_headers(headers: Dict[str, str]) -> Recipients:
+    """Build Recipients from headers returned by extract_headers."""
+    return Recipients(
+        to=headers.get("to", ""),
+        cc=headers.get("cc", ""),
+    )
+
+
+def extract_threading_info(message: Dict[str, Any]) -> ThreadingInfo:
     """
     Extract threading information from a Gmail message.
 
@@ -33,7 +230,7 @@ def extract_threading_info(message: Dict[str, Any]) -> Dict[str, str]:
         message: Gmail API message response (from messages.get)
 
     Returns:
-        Dict with keys:
+        ThreadingInfo with attributes:
             - thread_id: Gmail thread ID
             - message_id: RFC 2822 Message-ID header value
             - subject: Email subject
@@ -42,39 +239,11 @@ def extract_threading_info(message: Dict[str, Any]) -> Dict[str, str]:
             - references: Existing References header (may be empty)
             - date: Date header value
     """
-    result = {
-        "thread_id": message.get("threadId", ""),
-        "message_id": "",
-        "subject": "",
-        "from_email": "",
-        "from_name": "",
-        "references": "",
-        "date": "",
-    }
+    headers = extract_headers(message, _THREADING_HEADERS)
+    return _threading_info_from_headers(message, headers)
 
-    headers = message.get("payload", {}).get("headers", [])
-    for header in headers:
-        name = header.get("name", "").lower()
-        value = header.get("value", "")
-
-        if name == "message-id":
-            result["message_id"] = value
-        elif name == "subject":
-            result["subject"] = value
-        elif name == "from":
-            # Parse "Display Name <email@example.com>" format
-            parsed_name, parsed_email = parseaddr(value)
-            result["from_name"] = parsed_name
-            result["from_email"] = parsed_email
-        elif name == "references":
-            result["references"] = value
-        elif name == "date":
-            result["date"] = value
 
-    return result
-
-
-def extract_recipients(message: Dict[str, Any]) -> Dict[str, str]:
+def extract_recipients(message: Dict[str, Any]) -> Recipients:
     """
     Extract recipient information from a Gmail message.
 
@@ -82,26 +251,32 @@ def extract_recipients(message: Dict[str, Any]) -> Dict[str, str]:
         message: Gmail API message response
 
     Returns:
-        Dict with keys:
+        Recipients with attributes:
             - to: To header value
             - cc: Cc header value (may be empty)
     """
-    result = {
-        "to": "",
-        "cc": "",
-    }
+    headers = extract_headers(message, _RECIPIENT_HEADERS)
+    return _recipients_from_headers(headers)
 
-    headers = message.get("payload", {}).get("headers", [])
-    for header in headers:
-        name = header.get("name", "").lower()
-        value = header.get("value", "")
 
-        if name == "to":
-            result["to"] = value
-        elif name == "cc":
-            result["cc"] = value
+def extract_threading_and_recipients(
+    message: Dict[str, Any]
+) -> tuple[ThreadingInfo, Recipients]:
+    """
+    Extract threading and recipient information in a single header scan.
 
-    return result
+    Equivalent to calling extract_threading_info and extract_recipients,
+    but walks the message headers only once. Use this when both are needed,
+    e.g. when building a reply or forward.
+
+    Args:
+        message: Gmail API message response (from messages.get)
+
+    Returns:
+        Tuple of (ThreadingInfo, Recipients)
+    """
+    headers = extract_headers(message, _THREADING_AND_RECIPIENT_HEADERS)
+    return _threading_info_from_headers(message, headers), _recipients_from_headers(headers)
 
 
 def build_references_chain(
@@ -128,15 +303,11 @@ def build_references_chain(
         >>> build_references_chain("<msg1@example.com>", "<msg2@example.com>")
         '<msg1@example.com> <msg2@example.com>'
     """
-    if not in_reply_to:
-        return existing_references or ""
-
-    if existing_references:
-        # Append new message-id to existing chain
+    # Append to an existing chain, otherwise start a new one (or keep the
+    # old one when there is nothing to append); None and "" are equivalent
+    if existing_references and in_reply_to:
         return f"{existing_references} {in_reply_to}"
-    else:
-        # Start new chain with the message being replied to
-        return in_reply_to
+    return existing_references or in_reply_to or ""
 
 
 def format_reply_subject(original_subject: str) -> str:
@@ -163,11 +334,11 @@ def format_reply_subject(original_subject: str) -> str:
     if not original_subject:
         return "Re:"
 
-    # Check for existing Re: (case-insensitive, with optional whitespace)
-    if re.match(r"^re:\s*", original_subject, re.IGNORECASE):
+    # Check for existing Re: (case-insensitive) without going through regex
+    if original_subject[:3].lower() == "re:":
         return original_subject
 
-    return f"Re: {original_subject}"
+    return "Re: " + original_subject
 
 
 def format_forward_subject(original_subject: str) -> str:
@@ -195,10 +366,24 @@ def format_forward_subject(original_subject: str) -> str:
         return "Fwd:"
 
     # Check for existing Fwd:/FW:/Fw: (case-insensitive)
-    if re.match(r"^(fwd?|fw):\s*", original_subject, re.IGNORECASE):
+    if original_subject[:4].lower().startswith(_FWD_PREFIXES):
         return original_subject
 
-    return f"Fwd: {original_subject}"
+    return "Fwd: " + original_subject
+
+
+def _body_to_html(body: str) -> str:
+    """
+    Escape HTML entities in a plain-text body and convert newlines to <br>.
+
+    Uses chained str.replace rather than a str.translate table: translate
+    with multi-character replacements takes CPython's per-character slow
+    path, while replace is a fast search that returns the string unchanged
+    when there is nothing to substitute.
+    """
+    for char, entity in _HTML_ESCAPES:
+        body = body.replace(char, entity)
+    return body.replace("\n", "<br>")
 
 
 def format_quoted_body(
@@ -229,25 +414,15 @@ def format_quoted_body(
     sender = from_name if from_name else from_email
 
     if as_html:
-        # Escape HTML entities in the original body
-        escaped_body = (
-            original_body
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
-        # Convert newlines to HTML breaks
-        quoted_body = escaped_body.replace("\n", "<br>")
-
-        return f"""<br><br>
-<div style="border-left: 2px solid #ccc; padding-left: 10px; margin-left: 5px; color: #555;">
-<p style="margin: 0 0 10px 0;">On {date}, {sender} &lt;{from_email}&gt; wrote:</p>
-<div>{quoted_body}</div>
-</div>"""
+        quoted_body = _body_to_html(original_body)
+
+        return "".join((
+            _QUOTE_HTML_PREFIX, date, ", ", sender, " &lt;", from_email,
+            _QUOTE_HTML_MID, quoted_body, _QUOTE_HTML_SUFFIX,
+        ))
     else:
         # Plain text quote format with ">" prefix
-        quoted_lines = [f"> {line}" for line in original_body.split("\n")]
-        quoted_body = "\n".join(quoted_lines)
+        quoted_body = "> " + original_body.replace("\n", "\n> ")
         return f"\n\nOn {date}, {sender} <{from_email}> wrote:\n{quoted_body}"
 
 
@@ -285,14 +460,7 @@ def format_forward_body(
     sender = from_name if from_name else from_email
 
     if as_html:
-        # Escape HTML entities in the original body
-        escaped_body = (
-            original_body
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
-        forwarded_body = escaped_body.replace("\n", "<br>")
+        forwarded_body = _body_to_html(original_body)
 
         # Process comment through formatting pipeline
         if comment:
@@ -301,14 +469,13 @@ def format_forward_body(
         else:
             comment_html = ""
 
-        return f"""{comment_html}<br><br>
----------- Forwarded message ----------<br>
-<b>From:</b> {sender} &lt;{from_email}&gt;<br>
-<b>Date:</b> {date}<br>
-<b>Subject:</b> {subject}<br>
-<b>To:</b> {to}<br>
-<br>
-{forwarded_body}"""
+        return "".join((
+            comment_html, _FORWARD_HTML_FROM, sender, " &lt;", from_email,
+            _FORWARD_HTML_DATE, date,
+            _FORWARD_HTML_SUBJECT, subject,
+            _FORWARD_HTML_TO, to,
+            _FORWARD_HTML_END, forwarded_body,
+        ))
     else:
         header = f"""
 ---------- Forwarded message ----------
@@ -321,6 +488,58 @@ To: {to}
         return f"{comment}\n{header}{original_body}" if comment else f"{header}{original_body}"
 
 
+def _is_artificial_break(match: "re.Match[str]") -> bool:
+    """
+    Decide whether a line break matched by _RE_LINE_BREAK is artificial.
+
+    The match holds a line (group 1) and its newline, the leading blanks
+    of the following line (group 2) and that line's first non-blank
+    character (group 3).
+    """
+    current_line = match.group(1)
+    trimmed_line = current_line.strip()
+
+    # The previous match may have consumed this line's leading blanks, so
+    # measure the full line from its start in the source text
+    line_start = match.string.rfind("\n", 0, match.start(1)) + 1
+    line_length = match.end(1) - line_start
+
+    return (
+        0 < line_length < 100
+        and _RE_ENDS_WORD.search(trimmed_line) is not None
+        and _RE_ENDS_SENT.search(trimmed_line) is None
+        and (
+            _RE_NEXT_LOWER.match(match.group(3)) is not None
+            or _RE_CONNECTOR.search(trimmed_line) is not None
+            or _RE_ADJECTIVE.search(trimmed_line) is not None
+        )
+    )
+
+
+def _join_artificial_break(match: "re.Match[str]") -> str:
+    """
+    Substitution callback for remove_artificial_line_breaks.
+
+    Returns either the line joined to the next with a single space or the
+    line with its newline and the next line's indent kept.
+    """
+    if _is_artificial_break(match):
+        return match.group(1).rstrip() + " "
+    return match.group(1) + "\n" + match.group(2)
+
+
+def _join_artificial_break_html(match: "re.Match[str]") -> str:
+    """
+    Substitution callback for prepare_email_body.
+
+    Like _join_artificial_break, but emits <br> for the line breaks that
+    are kept so newline conversion happens in the same pass.
+    """
+    if _is_artificial_break(match):
+        return match.group(1).rstrip() + " "
+    return match.group(1) + "<br>" + match.group(2)
+
+
 def remove_artificial_line_breaks(text: str) -> str:
     """
     Remove artificial line breaks from text.
@@ -353,59 +572,17 @@ def remove_artificial_line_breaks(text: str) -> str:
     # First normalize escaped newlines to real newlines for processing
     normalized = text.replace("\\n", "\n")
 
-    # Split into lines for analysis
-    lines = normalized.split("\n")
-    result = []
-
-    # German articles, prepositions, conjunctions that typically precede nouns
-    # Note: Avoid single-letter words (a, I) as they cause false positives (e.g., "Option A")
-    connector_pattern = re.compile(
-        r'\b(mit|und|oder|der|die|das|den|dem|des|ein|eine|einem|einer|eines|'
-        r'zu|von|für|bei|nach|über|unter|durch|ohne|gegen|bis|seit|als|wie|'
-        r'auf|aus|vor|hinter|neben|zwischen|an|in|im|am|zum|zur|vom|beim|'
-        r'the|of|to|for|on|with|at|by|from|into|onto)\s*$',
-        re.IGNORECASE
-    )
-
-    # German adjective endings (precede nouns) - require 5+ chars before ending to avoid false positives like "Option"
-    adjective_pattern = re.compile(r'\b\w{5,}(en|er|es|em)\s*$', re.IGNORECASE)
-
-    i = 0
-    while i < len(lines):
-        current_line = lines[i]
-        next_line = lines[i + 1] if i + 1 < len(lines) else None
-
-        trimmed_line = current_line.strip()
-        trimmed_next = next_line.strip() if next_line else ""
-
-        # Check various conditions
-        ends_with_word = bool(re.search(r'\w$', trimmed_line))
-        ends_with_sentence_punct = bool(re.search(r'[.?!:;]$', trimmed_line))
-        next_starts_lowercase = bool(re.search(r'^[a-zäöü]', trimmed_next))
-        ends_with_connector = bool(connector_pattern.search(trimmed_line))
-        ends_with_adjective = bool(adjective_pattern.search(trimmed_line))
-
-        is_artificial_break = (
-            next_line is not None
-            and len(current_line) > 0
-            and len(current_line) < 100
-            and ends_with_word
-            and not ends_with_sentence_punct
-            and (next_starts_lowercase or ends_with_connector or ends_with_adjective)
-        )
-
-        if is_artificial_break:
-            # Join with the next line using a space
-            result.append(current_line.rstrip() + " ")
-        else:
-            result.append(current_line)
-            # Add newline back unless it's the last line
-            if i < len(lines) - 1:
-                result.append("\n")
+    # Decide each line break in a single re.sub pass over the text
+    return _RE_LINE_BREAK.sub(_join_artificial_break, normalized)
 
-        i += 1
 
-    return "".join(result)
+def _has_html_structure(content: str) -> bool:
+    """Check whether content already contains an <html>, <body> or styled <div>."""
+    # Every marker starts with "<"; a plain substring test rules out the
+    # common plain-text case without running the regex over the content
+    if "<" not in content:
+        return False
+    return _RE_HTML_STRUCT.search(content) is not None
 
 
 def wrap_with_gmail_template(content: str) -> str:
@@ -429,18 +606,18 @@ def wrap_with_gmail_template(content: str) -> str:
         return ""
 
     # Check if already has HTML structure
-    if re.search(r'<html|<body|<div\s+style', content, re.IGNORECASE):
+    if _has_html_structure(content):
         return content
 
-    return GMAIL_HTML_TEMPLATE.replace("{content}", content)
+    return _TEMPLATE_PREFIX + content + _TEMPLATE_SUFFIX
 
 
 def convert_newlines_to_html(text: str) -> str:
     """
     Convert plain text newlines to HTML line breaks.
 
-    Handles both paragraph breaks (double newlines) and
-    single line breaks appropriately. Also handles escaped
+    Every newline becomes one <br>, so paragraph breaks (double
+    newlines) naturally become <br><br>. Also handles escaped
     newlines (literal \\n strings) that may come from JSON
     transport or MCP tool calls.
 
@@ -461,23 +638,17 @@ def convert_newlines_to_html(text: str) -> str:
     if not text:
         return ""
 
-    # First handle escaped newlines (literal backslash-n from JSON/MCP transport)
-    # Must do this BEFORE handling real newlines
-    # Handle double escaped newlines first (paragraphs)
-    text = text.replace("\\n\\n", "<br><br>")
-    # Then single escaped newlines
-    text = text.replace("\\n", "<br>")
+    # Without a backslash there can be no escaped newlines, so a plain
+    # str.replace (no regex engine) covers the common case
+    if "\\" not in text:
+        return text.replace("\n", "<br>")
 
-    # Then handle real newlines (for direct function calls)
-    # Double newlines (paragraphs)
-    text = text.replace("\n\n", "<br><br>")
-    # Single newlines
-    text = text.replace("\n", "<br>")
+    # Escaped newlines (literal backslash-n from JSON/MCP transport) and real
+    # newlines are converted in one pass; paragraph breaks fall out as <br><br>
+    return _NL_RE.sub("<br>", text)
 
-    return text
 
-
-def prepare_email_body(text: str) -> str:
+def prepare_email_body(text: str, plain_text: bool = False) -> str:
     """
     Prepare email body for Gmail API.
 
@@ -486,8 +657,15 @@ def prepare_email_body(text: str) -> str:
     2. Converts newlines to HTML <br> tags
     3. Wraps in Gmail HTML template with font styling
 
+    Steps 1 and 2 run as a single substitution pass over the text, so the
+    result matches calling remove_artificial_line_breaks,
+    convert_newlines_to_html and wrap_with_gmail_template in turn.
+
     Args:
         text: Plain text email body
+        plain_text: If True, the caller guarantees the text contains no
+            HTML structure, so the check that prevents re-wrapping
+            existing HTML is skipped
 
     Returns:
         Formatted HTML ready for Gmail API
@@ -499,18 +677,20 @@ def prepare_email_body(text: str) -> str:
     if not text:
         return ""
 
-    # 1. Remove artificial line breaks
-    processed = remove_artificial_line_breaks(text)
+    # Escaped newlines (from JSON/MCP transport) become real ones first
+    normalized = text.replace("\\n", "\n")
 
-    # 2. Convert newlines to HTML
-    processed = convert_newlines_to_html(processed)
+    # Remove artificial line breaks and convert the rest to <br> in one pass
+    content = _RE_LINE_BREAK.sub(_join_artificial_break_html, normalized)
 
-    # 3. Wrap in template
-    processed = wrap_with_gmail_template(processed)
+    # Don't re-wrap content that already has HTML structure
+    if not plain_text and _has_html_structure(content):
+        return content
 
-    return processed
+    return _TEMPLATE_PREFIX + content + _TEMPLATE_SUFFIX
 
 
+@lru_cache(maxsize=1024)
 def _extract_email_address(addr: str) -> str:
     """
     Extract the email address from a potentially formatted string.
@@ -520,16 +700,41 @@ def _extract_email_address(addr: str) -> str:
     - "Display Name <user@example.com>"
     - "<user@example.com>"
 
+    Simple forms are handled directly; everything else (quoted names,
+    comments, malformed input) goes through email.utils.parseaddr.
+
     Args:
         addr: Email string, possibly with display name
 
     Returns:
         Just the email address, lowercased
     """
+    if not addr:
+        return ""
+
+    # Fast path: a bare address with nothing that needs RFC 5322 parsing
+    if not _ADDR_NEEDS_PARSE.search(addr):
+        return addr.lower()
+
+    # Fast path: "Display Name <user@example.com>" with a plain display
+    # name (no quotes, commas or other specials) and a plain address
+    lt = addr.rfind("<")
+    if lt >= 0 and addr.endswith(">") and not _ADDR_NAME_NEEDS_PARSE.search(addr, 0, lt):
+        inner = addr[lt + 1:-1]
+        if _ADDR_PLAIN.fullmatch(inner):
+            return inner.lower()
+
     _, email = parseaddr(addr)
     return email.lower() if email else addr.lower()
 
 
+def _split_addresses(value: str) -> List[str]:
+    """Split an address-list header into its non-empty, stripped entries."""
+    if not value:
+        return []
+    return [entry for entry in map(str.strip, _ADDR_TOKEN.findall(value)) if entry]
+
+
 def filter_reply_all_recipients(
     original_from: str,
     original_to: str,
@@ -551,33 +756,27 @@ def filter_reply_all_recipients(
     Returns:
         Tuple of (to_addresses, cc_addresses)
     """
-    user_email_lower = user_email.lower()
-
-    def is_user_email(addr: str) -> bool:
-        """Check if addr matches user's email (exact match, not substring)."""
-        extracted = _extract_email_address(addr)
-        return extracted == user_email_lower
+    # Extracted (lowercase) addresses already used or excluded; seeding it
+    # with the user's email folds the "not to self" check into the dedup
+    seen_emails = {_extract_email_address(user_email)}
 
-    # Start with original sender as primary recipient
     to_addresses = []
-    if original_from and not is_user_email(original_from):
-        to_addresses.append(original_from)
-
-    # Process original To recipients
-    if original_to:
-        for addr in original_to.split(","):
-            addr = addr.strip()
-            if addr and not is_user_email(addr):
-                if addr not in to_addresses:
-                    to_addresses.append(addr)
-
-    # Process original Cc recipients
     cc_addresses = []
-    if original_cc:
-        for addr in original_cc.split(","):
-            addr = addr.strip()
-            if addr and not is_user_email(addr):
-                if addr not in to_addresses and addr not in cc_addresses:
-                    cc_addresses.append(addr)
+
+    # Original sender first, then original To recipients, go to To;
+    # original Cc recipients stay in Cc
+    sources = (
+        (to_addresses, (original_from,)),
+        (to_addresses, _split_addresses(original_to)),
+        (cc_addresses, _split_addresses(original_cc)),
+    )
+    for target, addrs in sources:
+        for addr in addrs:
+            if not addr:
+                continue  # empty original_from
+            email = _extract_email_address(addr)
+            if email not in seen_emails:
+                seen_emails.add(email)
+                target.append(addr)
 
     return ", ".join(to_addresses), ", ".join(cc_addresses)
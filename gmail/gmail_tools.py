@@ -238,10 +238,10 @@ def _extract_headers(payload: dict, header_names: List[str]) -> Dict[str, str]:
     headers = {}
     target_headers = {name.lower(): name for name in header_names}
     for header in payload.get("headers", []):
-        header_name_lower = header["name"].lower()
-        if header_name_lower in target_headers:
-            # Store using the original requested casing
-            headers[target_headers[header_name_lower]] = header["value"]
+        requested_name = target_headers.get(header["name"].lower())
+        if requested_name is not None:
+            # Store using the original requested casing; later duplicates win
+            headers[requested_name] = header["value"]
     return headers
 
 
@@ -277,7 +277,7 @@ def _prepare_gmail_message(
     """
     # Handle reply subject formatting
     reply_subject = subject
-    if in_reply_to and not subject.lower().startswith("re:"):
+    if in_reply_to and subject[:3].lower() != "re:":
         reply_subject = f"Re: {subject}"
 
     # Prepare the email
@@ -1160,8 +1160,7 @@ async def draft_gmail_message(
 
 # Import helpers for reply/forward functionality
 from gmail.gmail_helpers import (
-    extract_threading_info,
-    extract_recipients,
+    extract_threading_and_recipients,
     build_references_chain,
     format_reply_subject,
     format_forward_subject,
@@ -1217,15 +1216,14 @@ async def _reply_gmail_draft_impl(
     )
 
     # 2. Extract threading info
-    threading_info = extract_threading_info(original_message)
-    recipients_info = extract_recipients(original_message)
+    threading_info, recipients_info = extract_threading_and_recipients(original_message)
 
     # 3. Determine recipients
     if reply_all:
         to_address, cc_from_original = filter_reply_all_recipients(
-            original_from=threading_info["from_email"],
-            original_to=recipients_info["to"],
-            original_cc=recipients_info["cc"],
+            original_from=threading_info.from_email,
+            original_to=recipients_info.to,
+            original_cc=recipients_info.cc,
             user_email=user_google_email
         )
         # Merge user-provided CC with original CC recipients
@@ -1236,16 +1234,16 @@ async def _reply_gmail_draft_impl(
         else:
             final_cc = cc
     else:
-        to_address = threading_info["from_email"]
+        to_address = threading_info.from_email
         final_cc = cc
 
     # 4. Format subject
-    subject = format_reply_subject(threading_info["subject"])
+    subject = format_reply_subject(threading_info.subject)
 
     # 5. Build References chain
     references = build_references_chain(
-        threading_info.get("references", ""),
-        threading_info["message_id"]
+        threading_info.references,
+        threading_info.message_id
     )
 
     # 6. Format body
@@ -1263,9 +1261,9 @@ async def _reply_gmail_draft_impl(
 
         quote = format_quoted_body(
             original_text,
-            threading_info["from_name"],
-            threading_info["from_email"],
-            threading_info["date"],
+            threading_info.from_name,
+            threading_info.from_email,
+            threading_info.date,
             as_html=True
         )
         html_body = html_body + quote
@@ -1280,8 +1278,8 @@ async def _reply_gmail_draft_impl(
         to=to_address,
         cc=final_cc,
         bcc=bcc,
-        thread_id=threading_info["thread_id"],
-        in_reply_to=threading_info["message_id"],
+        thread_id=threading_info.thread_id,
+        in_reply_to=threading_info.message_id,
         references=references,
         body_format="html",
         from_email=user_google_email,
@@ -1290,7 +1288,7 @@ async def _reply_gmail_draft_impl(
     draft_body = {
         "message": {
             "raw": raw_message,
-            "threadId": threading_info["thread_id"],
+            "threadId": threading_info.thread_id,
         }
     }
 
@@ -1300,13 +1298,13 @@ async def _reply_gmail_draft_impl(
 
     draft_id = created_draft.get("id")
     logger.info(
-        f"[reply_gmail_draft] Created draft {draft_id} in thread {threading_info['thread_id']}"
+        f"[reply_gmail_draft] Created draft {draft_id} in thread {threading_info.thread_id}"
     )
 
     return (
         f"Reply draft created!\n"
         f"Draft ID: {draft_id}\n"
-        f"Thread ID: {threading_info['thread_id']}\n"
+        f"Thread ID: {threading_info.thread_id}\n"
         f"To: {to_address}"
     )
 
@@ -1417,11 +1415,10 @@ async def _forward_gmail_draft_impl(
     )
 
     # 2. Extract info
-    threading_info = extract_threading_info(original_message)
-    recipients_info = extract_recipients(original_message)
+    threading_info, recipients_info = extract_threading_and_recipients(original_message)
 
     # 3. Format subject
-    subject = format_forward_subject(threading_info["subject"])
+    subject = format_forward_subject(threading_info.subject)
 
     # 4. Extract original body
     payload = original_message.get("payload", {})
@@ -1432,11 +1429,11 @@ async def _forward_gmail_draft_impl(
     # Note: format_forward_body already applies remove_artificial_line_breaks to comment
     full_body = format_forward_body(
         original_body=original_text,
-        from_name=threading_info["from_name"],
-        from_email=threading_info["from_email"],
-        to=recipients_info["to"],
-        date=threading_info["date"],
-        subject=threading_info["subject"],
+        from_name=threading_info.from_name,
+        from_email=threading_info.from_email,
+        to=recipients_info.to,
+        date=threading_info.date,
+        subject=threading_info.subject,
         comment=body or "",
         as_html=True
     )
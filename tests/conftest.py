@@ -10,6 +10,8 @@ SECURITY NOTE:
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 import base64
+import copy
+from types import MappingProxyType
 
 # =============================================================================
 # SECURITY: Generic test constants - NO real data
@@ -52,134 +54,152 @@ def mock_gmail_service():
     return service
 
 
-@pytest.fixture
+# =============================================================================
+# Sample Gmail API responses
+#
+# Built once at import time and handed out as top-level read-only views. The
+# view is shallow: nested dicts and lists are shared across the session, so
+# tests that need to modify a response should take copy.deepcopy(dict(view)).
+# =============================================================================
+
+_SAMPLE_MESSAGE_RESPONSE = {
+    "id": TEST_MSG_ID,
+    "threadId": TEST_THREAD_ID,
+    "labelIds": ["INBOX"],
+    "snippet": "This is a test message snippet...",
+    "payload": {
+        "partId": "",
+        "mimeType": "text/plain",
+        "headers": [
+            {"name": "Subject", "value": "Test Subject"},
+            {"name": "From", "value": f"Test Sender <{TEST_SENDER_EMAIL}>"},
+            {"name": "To", "value": TEST_RECIPIENT_EMAIL},
+            {"name": "Cc", "value": TEST_CC_EMAIL},
+            {"name": "Message-ID", "value": TEST_MESSAGE_ID_HEADER},
+            {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 +0000"},
+            {"name": "References", "value": "<earlier-msg@test.example.com>"},
+        ],
+        "body": {
+            "size": 24,
+            "data": base64.urlsafe_b64encode(b"Test message body content").decode(),
+        },
+    },
+    "sizeEstimate": 1024,
+    "historyId": "12345",
+    "internalDate": "1737370800000",
+}
+
+
+_SAMPLE_HTML_CONTENT = "<html><body><p>This is a <strong>test</strong> message.</p></body></html>"
+
+_SAMPLE_MESSAGE_HTML_RESPONSE = {
+    "id": "msg-test-002",
+    "threadId": TEST_THREAD_ID,
+    "labelIds": ["INBOX"],
+    "payload": {
+        "partId": "",
+        "mimeType": "multipart/alternative",
+        "headers": [
+            {"name": "Subject", "value": "HTML Test Subject"},
+            {"name": "From", "value": f"Test Sender <{TEST_SENDER_EMAIL}>"},
+            {"name": "To", "value": TEST_RECIPIENT_EMAIL},
+            {"name": "Message-ID", "value": "<test-msg-002@mail.test.example.com>"},
+            {"name": "Date", "value": "Mon, 20 Jan 2026 11:00:00 +0000"},
+        ],
+        "parts": [
+            {
+                "partId": "0",
+                "mimeType": "text/plain",
+                "body": {
+                    "size": 20,
+                    "data": base64.urlsafe_b64encode(b"This is a test message.").decode(),
+                },
+            },
+            {
+                "partId": "1",
+                "mimeType": "text/html",
+                "body": {
+                    "size": len(_SAMPLE_HTML_CONTENT),
+                    "data": base64.urlsafe_b64encode(_SAMPLE_HTML_CONTENT.encode()).decode(),
+                },
+            },
+        ],
+    },
+}
+
+_SAMPLE_DRAFT_RESPONSE = {
+    "id": TEST_DRAFT_ID,
+    "message": {
+        "id": "msg-from-draft-001",
+        "threadId": TEST_THREAD_ID,
+        "labelIds": ["DRAFT"],
+    },
+}
+
+_SAMPLE_REPLY_MESSAGE = {
+    "id": "msg-test-reply-001",
+    "threadId": TEST_THREAD_ID,
+    "payload": {
+        "headers": [
+            {"name": "Subject", "value": "Re: Test Subject"},
+            {"name": "From", "value": f"Test Recipient <{TEST_RECIPIENT_EMAIL}>"},
+            {"name": "To", "value": TEST_SENDER_EMAIL},
+            {"name": "Message-ID", "value": "<test-msg-reply-001@mail.test.example.com>"},
+            {"name": "In-Reply-To", "value": TEST_MESSAGE_ID_HEADER},
+            {"name": "References", "value": TEST_MESSAGE_ID_HEADER},
+            {"name": "Date", "value": "Mon, 20 Jan 2026 12:00:00 +0000"},
+        ],
+        "body": {
+            "data": base64.urlsafe_b64encode(b"This is a reply.").decode(),
+        },
+    },
+}
+
+_SAMPLE_THREAD_RESPONSE = {
+    "id": TEST_THREAD_ID,
+    "historyId": "12346",
+    "messages": [copy.deepcopy(_SAMPLE_MESSAGE_RESPONSE), _SAMPLE_REPLY_MESSAGE],
+}
+
+
+@pytest.fixture(scope="session")
 def sample_message_response():
     """
-    Sample Gmail API message response.
+    Sample Gmail API message response (read-only view).
 
     SECURITY: Uses only generic test data.
     """
-    return {
-        "id": TEST_MSG_ID,
-        "threadId": TEST_THREAD_ID,
-        "labelIds": ["INBOX"],
-        "snippet": "This is a test message snippet...",
-        "payload": {
-            "partId": "",
-            "mimeType": "text/plain",
-            "headers": [
-                {"name": "Subject", "value": "Test Subject"},
-                {"name": "From", "value": f"Test Sender <{TEST_SENDER_EMAIL}>"},
-                {"name": "To", "value": TEST_RECIPIENT_EMAIL},
-                {"name": "Cc", "value": TEST_CC_EMAIL},
-                {"name": "Message-ID", "value": TEST_MESSAGE_ID_HEADER},
-                {"name": "Date", "value": "Mon, 20 Jan 2026 10:00:00 +0000"},
-                {"name": "References", "value": "<earlier-msg@test.example.com>"},
-            ],
-            "body": {
-                "size": 24,
-                "data": base64.urlsafe_b64encode(b"Test message body content").decode(),
-            },
-        },
-        "sizeEstimate": 1024,
-        "historyId": "12345",
-        "internalDate": "1737370800000",
-    }
+    return MappingProxyType(_SAMPLE_MESSAGE_RESPONSE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_message_html_response():
     """
-    Sample Gmail API message response with HTML body.
+    Sample Gmail API message response with HTML body (read-only view).
 
     SECURITY: Uses only generic test data.
     """
-    html_content = "<html><body><p>This is a <strong>test</strong> message.</p></body></html>"
-
-    return {
-        "id": "msg-test-002",
-        "threadId": TEST_THREAD_ID,
-        "labelIds": ["INBOX"],
-        "payload": {
-            "partId": "",
-            "mimeType": "multipart/alternative",
-            "headers": [
-                {"name": "Subject", "value": "HTML Test Subject"},
-                {"name": "From", "value": f"Test Sender <{TEST_SENDER_EMAIL}>"},
-                {"name": "To", "value": TEST_RECIPIENT_EMAIL},
-                {"name": "Message-ID", "value": "<test-msg-002@mail.test.example.com>"},
-                {"name": "Date", "value": "Mon, 20 Jan 2026 11:00:00 +0000"},
-            ],
-            "parts": [
-                {
-                    "partId": "0",
-                    "mimeType": "text/plain",
-                    "body": {
-                        "size": 20,
-                        "data": base64.urlsafe_b64encode(b"This is a test message.").decode(),
-                    },
-                },
-                {
-                    "partId": "1",
-                    "mimeType": "text/html",
-                    "body": {
-                        "size": len(html_content),
-                        "data": base64.urlsafe_b64encode(html_content.encode()).decode(),
-                    },
-                },
-            ],
-        },
-    }
+    return MappingProxyType(_SAMPLE_MESSAGE_HTML_RESPONSE)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_draft_response():
     """
-    Sample Gmail API draft creation response.
+    Sample Gmail API draft creation response (read-only view).
 
     SECURITY: Uses only generic test data.
     """
-    return {
-        "id": TEST_DRAFT_ID,
-        "message": {
-            "id": "msg-from-draft-001",
-            "threadId": TEST_THREAD_ID,
-            "labelIds": ["DRAFT"],
-        },
-    }
+    return MappingProxyType(_SAMPLE_DRAFT_RESPONSE)
 
 
-@pytest.fixture
-def sample_thread_response(sample_message_response):
+@pytest.fixture(scope="session")
+def sample_thread_response():
     """
-    Sample Gmail API thread response with multiple messages.
+    Sample Gmail API thread response with multiple messages (read-only view).
 
     SECURITY: Uses only generic test data.
     """
-    reply_message = {
-        "id": "msg-test-reply-001",
-        "threadId": TEST_THREAD_ID,
-        "payload": {
-            "headers": [
-                {"name": "Subject", "value": "Re: Test Subject"},
-                {"name": "From", "value": f"Test Recipient <{TEST_RECIPIENT_EMAIL}>"},
-                {"name": "To", "value": TEST_SENDER_EMAIL},
-                {"name": "Message-ID", "value": "<test-msg-reply-001@mail.test.example.com>"},
-                {"name": "In-Reply-To", "value": TEST_MESSAGE_ID_HEADER},
-                {"name": "References", "value": TEST_MESSAGE_ID_HEADER},
-                {"name": "Date", "value": "Mon, 20 Jan 2026 12:00:00 +0000"},
-            ],
-            "body": {
-                "data": base64.urlsafe_b64encode(b"This is a reply.").decode(),
-            },
-        },
-    }
-
-    return {
-        "id": TEST_THREAD_ID,
-        "historyId": "12346",
-        "messages": [sample_message_response, reply_message],
-    }
+    return MappingProxyType(_SAMPLE_THREAD_RESPONSE)
 
 
 # =============================================================================
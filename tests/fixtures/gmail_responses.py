@@ -8,9 +8,25 @@ SECURITY NOTE:
 - These fixtures simulate Gmail API responses for testing only
 """
 
-import base64
+import binascii
+import functools
+import json
 from typing import Dict, Any, List
 
+# Maps standard base64 alphabet to the URL-safe one ("+/" -> "-_")
+_URLSAFE_TRANS = bytes.maketrans(b"+/", b"-_")
+
+
+def _b64url(data: bytes) -> str:
+    """URL-safe base64 encode, as returned in Gmail API body data."""
+    return binascii.b2a_base64(data, newline=False).translate(_URLSAFE_TRANS).decode("ascii")
+
+
+# Fixed metadata shared by every message response
+_SIZE_ESTIMATE = 1024
+_HISTORY_ID = "12345"
+_INTERNAL_DATE = "1737370800000"
+
 
 def create_message_response(
     msg_id: str = "msg-test-001",
@@ -48,6 +64,51 @@ def create_message_response(
     Returns:
         Dict simulating Gmail API message response
     """
+    # Parsing the cached JSON hands every caller its own mutable dict, and is
+    # cheaper than deep-copying a cached one
+    return json.loads(_build_message_cached(
+        msg_id=msg_id,
+        thread_id=thread_id,
+        subject=subject,
+        from_email=from_email,
+        from_name=from_name,
+        to_email=to_email,
+        cc_email=cc_email,
+        message_id_header=message_id_header,
+        references=references,
+        in_reply_to=in_reply_to,
+        body_text=body_text,
+        body_html=body_html,
+        date=date,
+    ))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_message_cached(
+    *,
+    msg_id: str,
+    thread_id: str,
+    subject: str,
+    from_email: str,
+    from_name: str,
+    to_email: str,
+    cc_email: str,
+    message_id_header: str,
+    references: str,
+    in_reply_to: str,
+    body_text: str,
+    body_html: str,
+    date: str,
+) -> str:
+    """
+    Build a message response for create_message_response, memoized.
+
+    Takes the same arguments as create_message_response, keyword-only.
+
+    Returns:
+        The built response, serialized as JSON
+    """
+
     headers = [
         {"name": "Subject", "value": subject},
         {"name": "From", "value": f"{from_name} <{from_email}>"},
@@ -76,7 +137,7 @@ def create_message_response(
                     "mimeType": "text/plain",
                     "body": {
                         "size": len(body_text),
-                        "data": base64.urlsafe_b64encode(body_text.encode()).decode(),
+                        "data": _b64url(body_text.encode()),
                     },
                 },
                 {
@@ -84,7 +145,7 @@ def create_message_response(
                     "mimeType": "text/html",
                     "body": {
                         "size": len(body_html),
-                        "data": base64.urlsafe_b64encode(body_html.encode()).decode(),
+                        "data": _b64url(body_html.encode()),
                     },
                 },
             ],
@@ -95,20 +156,20 @@ def create_message_response(
             "headers": headers,
             "body": {
                 "size": len(body_text),
-                "data": base64.urlsafe_b64encode(body_text.encode()).decode(),
+                "data": _b64url(body_text.encode()),
             },
         }
 
-    return {
+    return json.dumps({
         "id": msg_id,
         "threadId": thread_id,
         "labelIds": ["INBOX"],
-        "snippet": body_text[:50] + "..." if len(body_text) > 50 else body_text,
+        "snippet": body_text if len(body_text) <= 50 else f"{body_text[:50]}...",
         "payload": payload,
-        "sizeEstimate": 1024,
-        "historyId": "12345",
-        "internalDate": "1737370800000",
-    }
+        "sizeEstimate": _SIZE_ESTIMATE,
+        "historyId": _HISTORY_ID,
+        "internalDate": _INTERNAL_DATE,
+    })
 
 
 def create_draft_response(
@@ -127,6 +188,17 @@ def create_draft_response(
     Returns:
         Dict simulating Gmail API draft creation response
     """
+    return json.loads(_build_draft_cached(draft_id, message_id, thread_id))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_draft_cached(draft_id: str, message_id: str, thread_id: str) -> str:
+    """
+    Build a draft response for create_draft_response, memoized.
+
+    Returns:
+        The built response, serialized as JSON
+    """
     response = {
         "id": draft_id,
         "message": {
@@ -138,7 +210,7 @@ def create_draft_response(
     if thread_id:
         response["message"]["threadId"] = thread_id
 
-    return response
+    return json.dumps(response)
 
 
 def create_thread_response(
@@ -186,7 +258,7 @@ def create_thread_response(
 
     return {
         "id": thread_id,
-        "historyId": "12345",
+        "historyId": _HISTORY_ID,
         "messages": messages,
     }
 
@@ -195,6 +267,10 @@ def create_thread_response(
 # Edge case fixtures
 # =============================================================================
 
+# Ten-message References chain used by create_message_long_references
+_LONG_REFS = " ".join(f"<msg-{i}@test.example.com>" for i in range(10))
+
+
 def create_message_no_subject() -> Dict[str, Any]:
     """Message with no subject header."""
     return create_message_response(
@@ -206,22 +282,19 @@ def create_message_no_subject() -> Dict[str, Any]:
 def create_message_no_from_name() -> Dict[str, Any]:
     """Message with email only in From (no display name)."""
     response = create_message_response(msg_id="msg-no-name")
-    # Override From header to be email-only
-    for header in response["payload"]["headers"]:
-        if header["name"] == "From":
-            header["value"] = "sender@test.example.com"
-            break
+    # Override From header to be email-only; create_message_response always
+    # puts From second
+    from_header = response["payload"]["headers"][1]
+    assert from_header["name"] == "From", "create_message_response header order changed"
+    from_header["value"] = "sender@test.example.com"
     return response
 
 
 def create_message_long_references() -> Dict[str, Any]:
     """Message with long References chain (deep thread)."""
-    refs = " ".join([
-        f"<msg-{i}@test.example.com>" for i in range(10)
-    ])
     return create_message_response(
         msg_id="msg-deep-thread",
-        references=refs,
+        references=_LONG_REFS,
         in_reply_to="<msg-9@test.example.com>",
     )
 
@@ -238,7 +311,7 @@ def create_message_with_attachments() -> Dict[str, Any]:
             "mimeType": "text/plain",
             "body": {
                 "size": 24,
-                "data": base64.urlsafe_b64encode(b"Message with attachment").decode(),
+                "data": _b64url(b"Message with attachment"),
             },
         },
         {
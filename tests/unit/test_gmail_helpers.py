@@ -9,8 +9,10 @@ SECURITY NOTE:
 
 import pytest
 from gmail.gmail_helpers import (
+    extract_headers,
     extract_threading_info,
     extract_recipients,
+    extract_threading_and_recipients,
     build_references_chain,
     format_reply_subject,
     format_forward_subject,
@@ -25,6 +27,71 @@ from gmail.gmail_helpers import (
 )
 
 
+class TestExtractHeaders:
+    """Tests for extract_headers function."""
+
+    def test_extracts_wanted_headers_case_insensitively(self, sample_message_response):
+        """Test that only the wanted headers are returned, keyed lowercase."""
+        result = extract_headers(sample_message_response, frozenset({"subject", "message-id"}))
+
+        assert result == {
+            "subject": "Test Subject",
+            "message-id": "<test-msg-001@mail.test.example.com>",
+        }
+
+    def test_omits_missing_headers(self):
+        """Test that absent headers are not included in the result."""
+        message = {"payload": {"headers": [{"name": "To", "value": "a@test.example.com"}]}}
+        result = extract_headers(message, frozenset({"to", "cc"}))
+
+        assert result == {"to": "a@test.example.com"}
+
+    def test_keeps_first_occurrence(self):
+        """Test that the first occurrence of a repeated header wins."""
+        message = {
+            "payload": {
+                "headers": [
+                    {"name": "Subject", "value": "First"},
+                    {"name": "Subject", "value": "Second"},
+                ]
+            }
+        }
+        result = extract_headers(message, frozenset({"subject", "from"}))
+
+        assert result == {"subject": "First"}
+
+    def test_handles_missing_payload(self):
+        """Test handling of message with no payload."""
+        assert extract_headers({}, frozenset({"subject"})) == {}
+
+    def test_stops_once_all_wanted_headers_found(self):
+        """Test that headers after the last wanted one are not inspected."""
+        message = {
+            "payload": {
+                "headers": [
+                    {"name": "To", "value": "a@test.example.com"},
+                    {"name": "Cc", "value": "b@test.example.com"},
+                    None,  # would raise if the scan continued
+                ]
+            }
+        }
+        result = extract_headers(message, frozenset({"to", "cc"}))
+
+        assert result == {"to": "a@test.example.com", "cc": "b@test.example.com"}
+
+    def test_sees_header_values_changed_between_calls(self):
+        """Test that re-extracting from a modified message returns the new values."""
+        headers = [{"name": "Subject", "value": "Old"}, {"name": "To", "value": "a@test.example.com"}]
+        message = {"payload": {"headers": headers}}
+        wanted = frozenset({"subject", "to"})
+
+        extract_headers(message, wanted)
+        headers[0]["value"] = "New"
+        headers[1] = {"name": "To", "value": "b@test.example.com"}
+
+        assert extract_headers(message, wanted) == {"subject": "New", "to": "b@test.example.com"}
+
+
 class TestExtractThreadingInfo:
     """Tests for extract_threading_info function."""
 
@@ -32,31 +99,31 @@ class TestExtractThreadingInfo:
         """Test extraction of all threading fields from a complete message."""
         result = extract_threading_info(sample_message_response)
 
-        assert result["thread_id"] == "thread-test-abc123"
-        assert result["message_id"] == "<test-msg-001@mail.test.example.com>"
-        assert result["subject"] == "Test Subject"
-        assert result["from_email"] == "sender@test.example.com"
-        assert result["from_name"] == "Test Sender"
-        assert result["references"] == "<earlier-msg@test.example.com>"
+        assert result.thread_id == "thread-test-abc123"
+        assert result.message_id == "<test-msg-001@mail.test.example.com>"
+        assert result.subject == "Test Subject"
+        assert result.from_email == "sender@test.example.com"
+        assert result.from_name == "Test Sender"
+        assert result.references == "<earlier-msg@test.example.com>"
 
     def test_handles_missing_headers(self):
         """Test handling of message with no headers."""
         message = {"threadId": "t123", "payload": {"headers": []}}
         result = extract_threading_info(message)
 
-        assert result["thread_id"] == "t123"
-        assert result["message_id"] == ""
-        assert result["subject"] == ""
-        assert result["from_email"] == ""
-        assert result["from_name"] == ""
+        assert result.thread_id == "t123"
+        assert result.message_id == ""
+        assert result.subject == ""
+        assert result.from_email == ""
+        assert result.from_name == ""
 
     def test_handles_missing_payload(self):
         """Test handling of message with no payload."""
         message = {"threadId": "t456"}
         result = extract_threading_info(message)
 
-        assert result["thread_id"] == "t456"
-        assert result["message_id"] == ""
+        assert result.thread_id == "t456"
+        assert result.message_id == ""
 
     def test_parses_from_with_name(self):
         """Test parsing From header with display name."""
@@ -70,8 +137,8 @@ class TestExtractThreadingInfo:
         }
         result = extract_threading_info(message)
 
-        assert result["from_name"] == "John Doe"
-        assert result["from_email"] == "john@test.example.com"
+        assert result.from_name == "John Doe"
+        assert result.from_email == "john@test.example.com"
 
     def test_parses_from_email_only(self):
         """Test parsing From header with email only (no display name)."""
@@ -85,8 +152,8 @@ class TestExtractThreadingInfo:
         }
         result = extract_threading_info(message)
 
-        assert result["from_name"] == ""
-        assert result["from_email"] == "john@test.example.com"
+        assert result.from_name == ""
+        assert result.from_email == "john@test.example.com"
 
     def test_handles_quoted_display_name(self):
         """Test parsing From header with quoted display name."""
@@ -100,8 +167,64 @@ class TestExtractThreadingInfo:
         }
         result = extract_threading_info(message)
 
-        assert result["from_name"] == "Doe, John"
-        assert result["from_email"] == "john@test.example.com"
+        assert result.from_name == "Doe, John"
+        assert result.from_email == "john@test.example.com"
+
+    def test_parses_from_with_comment_style_name(self):
+        """Test parsing the legacy 'email (Name)' From form."""
+        message = {
+            "threadId": "t1",
+            "payload": {
+                "headers": [
+                    {"name": "From", "value": "john@test.example.com (John Doe)"}
+                ]
+            }
+        }
+        result = extract_threading_info(message)
+
+        assert result.from_name == "John Doe"
+        assert result.from_email == "john@test.example.com"
+
+    def test_stops_without_scanning_for_recipient_headers(self):
+        """Test that a message without Cc still lets the threading scan exit early."""
+        message = {
+            "threadId": "t1",
+            "payload": {
+                "headers": [
+                    {"name": "Message-ID", "value": "<m@test.example.com>"},
+                    {"name": "Subject", "value": "Hi"},
+                    {"name": "From", "value": "a@test.example.com"},
+                    {"name": "To", "value": "b@test.example.com"},
+                    {"name": "References", "value": "<r@test.example.com>"},
+                    {"name": "Date", "value": "Mon, 20 Jan 2026"},
+                    None,  # would raise if the scan continued
+                ]
+            }
+        }
+        result = extract_threading_info(message)
+
+        assert result.subject == "Hi"
+        assert result.date == "Mon, 20 Jan 2026"
+
+    def test_matches_non_canonical_header_casing(self):
+        """Test that header names in unusual casing are still found."""
+        message = {
+            "threadId": "t1",
+            "payload": {
+                "headers": [
+                    {"name": "MESSAGE-ID", "value": "<m1@test.example.com>"},
+                    {"name": "subject", "value": "Lowercase"},
+                    {"name": "fRoM", "value": "john@test.example.com"},
+                    {"name": "REFERENCES", "value": "<m0@test.example.com>"},
+                ]
+            }
+        }
+        result = extract_threading_info(message)
+
+        assert result.message_id == "<m1@test.example.com>"
+        assert result.subject == "Lowercase"
+        assert result.from_email == "john@test.example.com"
+        assert result.references == "<m0@test.example.com>"
 
 
 class TestExtractRecipients:
@@ -111,8 +234,8 @@ class TestExtractRecipients:
         """Test extraction of To and Cc headers."""
         result = extract_recipients(sample_message_response)
 
-        assert result["to"] == "recipient@test.example.com"
-        assert result["cc"] == "cc-user@test.example.com"
+        assert result.to == "recipient@test.example.com"
+        assert result.cc == "cc-user@test.example.com"
 
     def test_handles_missing_cc(self):
         """Test handling when Cc header is missing."""
@@ -125,8 +248,50 @@ class TestExtractRecipients:
         }
         result = extract_recipients(message)
 
-        assert result["to"] == "recipient@test.example.com"
-        assert result["cc"] == ""
+        assert result.to == "recipient@test.example.com"
+        assert result.cc == ""
+
+
+class TestExtractThreadingAndRecipients:
+    """Tests for extract_threading_and_recipients function."""
+
+    def test_matches_separate_extractors(self, sample_message_response):
+        """Test that the fused scan returns the same data as the separate helpers."""
+        threading_info, recipients = extract_threading_and_recipients(sample_message_response)
+
+        assert threading_info == extract_threading_info(sample_message_response)
+        assert recipients == extract_recipients(sample_message_response)
+
+    def test_handles_missing_payload(self):
+        """Test handling of message with no payload."""
+        threading_info, recipients = extract_threading_and_recipients({"threadId": "t1"})
+
+        assert threading_info.thread_id == "t1"
+        assert threading_info.message_id == ""
+        assert recipients.to == ""
+        assert recipients.cc == ""
+
+    def test_stops_before_trailing_headers(self):
+        """Test that the long tail after the last threading/recipient header is not scanned."""
+        message = {
+            "threadId": "t1",
+            "payload": {
+                "headers": [
+                    {"name": "Message-ID", "value": "<m@test.example.com>"},
+                    {"name": "Subject", "value": "Hi"},
+                    {"name": "From", "value": "a@test.example.com"},
+                    {"name": "To", "value": "b@test.example.com"},
+                    {"name": "Cc", "value": "c@test.example.com"},
+                    {"name": "References", "value": "<r@test.example.com>"},
+                    {"name": "Date", "value": "Mon, 20 Jan 2026"},
+                    None,  # stands in for Received/DKIM/ARC headers; would raise if reached
+                ]
+            },
+        }
+        threading_info, recipients = extract_threading_and_recipients(message)
+
+        assert threading_info.date == "Mon, 20 Jan 2026"
+        assert recipients.cc == "c@test.example.com"
 
 
 class TestBuildReferencesChain:
@@ -203,6 +368,12 @@ class TestFormatReplySubject:
         """Test that Re: with extra whitespace is preserved."""
         assert format_reply_subject("Re:  Test Subject") == "Re:  Test Subject"
 
+    def test_near_miss_prefixes_get_re(self):
+        """Test that subjects merely starting with 're' still get a Re: prefix."""
+        assert format_reply_subject("Reply needed") == "Re: Reply needed"
+        assert format_reply_subject("Re") == "Re: Re"
+        assert format_reply_subject("rE:") == "rE:"
+
 
 class TestFormatForwardSubject:
     """Tests for format_forward_subject function."""
@@ -231,6 +402,15 @@ class TestFormatForwardSubject:
         """Test handling of empty subject."""
         assert format_forward_subject("") == "Fwd:"
 
+    def test_does_not_treat_similar_words_as_prefix(self):
+        """Test that words merely starting with "fw" are not mistaken for a prefix."""
+        assert format_forward_subject("Fwd Test Subject") == "Fwd: Fwd Test Subject"
+        assert format_forward_subject("Forward: Test") == "Fwd: Forward: Test"
+
+    def test_handles_short_subject(self):
+        """Test subjects shorter than the prefix being checked."""
+        assert format_forward_subject("Fw") == "Fwd: Fw"
+
 
 class TestFormatQuotedBody:
     """Tests for format_quoted_body function."""
@@ -264,6 +444,18 @@ class TestFormatQuotedBody:
         assert "&lt;script&gt;" in result
         assert "<script>" not in result
 
+    def test_html_escapes_ampersand_once(self):
+        """Test that each special character is escaped exactly once."""
+        result = format_quoted_body(
+            original_body="Fish & chips <b>\n&lt;",
+            from_name="Sender",
+            from_email="sender@test.example.com",
+            date="Mon, 20 Jan 2026",
+            as_html=True
+        )
+
+        assert "<div>Fish &amp; chips &lt;b&gt;<br>&amp;lt;</div>" in result
+
     def test_plain_text_format(self):
         """Test plain text quote formatting."""
         result = format_quoted_body(
@@ -278,6 +470,18 @@ class TestFormatQuotedBody:
         assert "> World" in result
         assert "Test Sender <sender@test.example.com> wrote:" in result
 
+    def test_plain_text_quotes_every_line(self):
+        """Test that every line, including blank ones, gets a quote prefix."""
+        result = format_quoted_body(
+            original_body="First\n\nLast",
+            from_name="Test Sender",
+            from_email="sender@test.example.com",
+            date="Mon, 20 Jan 2026",
+            as_html=False
+        )
+
+        assert result.endswith("wrote:\n> First\n> \n> Last")
+
     def test_uses_email_when_no_name(self):
         """Test that email is used when display name is empty."""
         result = format_quoted_body(
@@ -347,6 +551,30 @@ class TestFormatForwardBody:
         assert "---------- Forwarded message ----------" in result
         assert "From: Sender <sender@test.example.com>" in result
 
+    def test_plain_text_format_with_comment_exact(self):
+        """Test exact plain text forward layout, including the comment separator."""
+        result = format_forward_body(
+            original_body="Line one\nLine two",
+            from_name="",
+            from_email="sender@test.example.com",
+            to="recipient@test.example.com",
+            date="Mon, 20 Jan 2026",
+            subject="Subject",
+            comment="FYI",
+            as_html=False
+        )
+
+        assert result == (
+            "FYI\n"
+            "\n---------- Forwarded message ----------\n"
+            "From: sender@test.example.com <sender@test.example.com>\n"
+            "Date: Mon, 20 Jan 2026\n"
+            "Subject: Subject\n"
+            "To: recipient@test.example.com\n"
+            "\n"
+            "Line one\nLine two"
+        )
+
 
 class TestConvertNewlinesToHtml:
     """Tests for convert_newlines_to_html function."""
@@ -403,6 +631,11 @@ class TestConvertNewlinesToHtml:
         result = convert_newlines_to_html("Real\n\nEscaped\\n\\nMixed")
         assert result == "Real<br><br>Escaped<br><br>Mixed"
 
+    def test_preserves_other_backslashes(self):
+        """Test that backslashes not followed by n are left untouched."""
+        result = convert_newlines_to_html("C:\\temp\\file\nnext\\nline")
+        assert result == "C:\\temp\\file<br>next<br>line"
+
 
 class TestFilterReplyAllRecipients:
     """Tests for filter_reply_all_recipients function."""
@@ -458,6 +691,18 @@ class TestFilterReplyAllRecipients:
         assert "ME@TEST.EXAMPLE.COM" not in to
         assert "other@test.example.com" in to
 
+    def test_uppercase_user_email_excluded(self):
+        """Test that the user's email is matched case-insensitively from either side."""
+        to, cc = filter_reply_all_recipients(
+            original_from="Me@Test.Example.com",
+            original_to="other@test.example.com",
+            original_cc="me@test.example.com",
+            user_email="ME@TEST.EXAMPLE.COM"
+        )
+
+        assert to == "other@test.example.com"
+        assert cc == ""
+
     def test_no_duplicates(self):
         """Test that duplicate addresses are removed."""
         to, cc = filter_reply_all_recipients(
@@ -470,6 +715,42 @@ class TestFilterReplyAllRecipients:
         # sender should only appear once
         assert to.count("sender@test.example.com") == 1
 
+    def test_cc_drops_addresses_already_in_to_and_keeps_order(self):
+        """Test that Cc entries already used in To are dropped and first-seen order is kept."""
+        to, cc = filter_reply_all_recipients(
+            original_from="sender@test.example.com",
+            original_to="b@test.example.com, a@test.example.com, B@test.example.com",
+            original_cc="a@test.example.com, c@test.example.com, c@test.example.com",
+            user_email="me@test.example.com"
+        )
+
+        assert to == "sender@test.example.com, b@test.example.com, a@test.example.com"
+        assert cc == "c@test.example.com"
+
+    def test_excludes_user_email_given_with_display_name(self):
+        """Test that the user's own address is excluded even if passed with a display name."""
+        to, cc = filter_reply_all_recipients(
+            original_from="sender@test.example.com",
+            original_to="Me <me@test.example.com>, other@test.example.com",
+            original_cc="ME@test.example.com",
+            user_email="My Name <me@test.example.com>"
+        )
+
+        assert to == "sender@test.example.com, other@test.example.com"
+        assert cc == ""
+
+    def test_no_duplicates_across_display_name_variants(self):
+        """Test that the same address with and without a display name is deduplicated."""
+        to, cc = filter_reply_all_recipients(
+            original_from="Sender <sender@test.example.com>",
+            original_to="SENDER@test.example.com, other@test.example.com",
+            original_cc="Other Person <other@test.example.com>",
+            user_email="me@test.example.com"
+        )
+
+        assert to == "Sender <sender@test.example.com>, other@test.example.com"
+        assert cc == ""
+
     def test_similar_email_not_filtered_substring_bug(self):
         """Test that similar emails are NOT incorrectly filtered (substring bug fix).
 
@@ -507,6 +788,42 @@ class TestFilterReplyAllRecipients:
         # Other should remain
         assert "other@test.example.com" in to or "Other <other@test.example.com>" in to
 
+    def test_quoted_display_name_with_comma_is_one_recipient(self):
+        """Test that a comma inside a quoted display name does not split the address."""
+        to, cc = filter_reply_all_recipients(
+            original_from="sender@test.example.com",
+            original_to='"Doe, John" <john@test.example.com>, "User, Me" <me@test.example.com>',
+            original_cc='"Roe, Jane" <jane@test.example.com>',
+            user_email="me@test.example.com"
+        )
+
+        assert to == 'sender@test.example.com, "Doe, John" <john@test.example.com>'
+        assert cc == '"Roe, Jane" <jane@test.example.com>'
+
+    def test_blank_list_entries_are_skipped(self):
+        """Test that empty entries from stray commas are ignored."""
+        to, cc = filter_reply_all_recipients(
+            original_from="sender@test.example.com",
+            original_to=" , a@test.example.com,, ",
+            original_cc=",",
+            user_email="me@test.example.com"
+        )
+
+        assert to == "sender@test.example.com, a@test.example.com"
+        assert cc == ""
+
+    def test_pathological_header_values_are_handled(self):
+        """Test that quote/bracket-heavy header values don't trigger regex backtracking blowups."""
+        for value in ('"' * 20001, "<" * 20000 + "@", '"a\\ ,' * 5000, "a@" * 10000):
+            to, cc = filter_reply_all_recipients(
+                original_from="sender@test.example.com",
+                original_to=value,
+                original_cc=value,
+                user_email="me@test.example.com"
+            )
+
+            assert to.startswith("sender@test.example.com")
+
 
 class TestExtractEmailAddress:
     """Tests for _extract_email_address helper function."""
@@ -551,6 +868,39 @@ class TestExtractEmailAddress:
         result = _extract_email_address("not-an-email")
         assert result == "not-an-email"
 
+    def test_angle_brackets_inside_quoted_name(self):
+        """Test that an address-like quoted display name is not mistaken for the address."""
+        result = _extract_email_address('"A <a@test.example.com>" <b@test.example.com>')
+        assert result == "b@test.example.com"
+
+    def test_repeated_addresses_served_from_cache(self):
+        """Test that addresses repeated across From/To/Cc are parsed only once."""
+        _extract_email_address.cache_clear()
+        filter_reply_all_recipients(
+            original_from='"Doe, John" <john@test.example.com>',
+            original_to='"Doe, John" <john@test.example.com>, other@test.example.com',
+            original_cc='"Doe, John" <john@test.example.com>',
+            user_email="me@test.example.com"
+        )
+
+        info = _extract_email_address.cache_info()
+        assert info.misses == 3  # user, john, other
+        assert info.hits == 2
+
+    def test_precompiled_fast_paths_agree_with_parseaddr(self):
+        """Test that inputs near the fast-path boundaries match parseaddr."""
+        from email.utils import parseaddr
+
+        for addr in (
+            "< John@Test.Example.com >",
+            "J. Doe <j@test.example.com>",
+            "Doe <j@test.example.com> (work)",
+            "John <not-an-email>",
+            " user@test.example.com",
+        ):
+            expected = parseaddr(addr)[1].lower() or addr.lower()
+            assert _extract_email_address(addr) == expected, addr
+
 
 class TestRemoveArtificialLineBreaks:
     """Tests for remove_artificial_line_breaks function."""
@@ -590,6 +940,13 @@ class TestRemoveArtificialLineBreaks:
 
         assert result == "This is a very long line that was artificially broken in the middle because of word wrapping at 70 characters."
 
+    def test_drops_indent_of_joined_continuation_line(self):
+        """Test that a joined line's leading whitespace collapses into one space."""
+        text = "Our team had a closer\n   look at it.\n  Indented line."
+        result = remove_artificial_line_breaks(text)
+
+        assert result == "Our team had a closer look at it.\n  Indented line."
+
     def test_handles_escaped_newlines(self):
         """Test handling of escaped newlines from JSON transport."""
         text = "This was artificially\\nbroken and should be joined."
@@ -715,3 +1072,26 @@ class TestPrepareEmailBody:
         result = prepare_email_body("First para.\n\nSecond para.")
 
         assert "<br><br>" in result
+
+    def test_matches_separate_pipeline_steps(self):
+        """Test that the fused pipeline matches running each step in turn."""
+        text = "Our team had a closer\nlook.\\n\\nText mit künstlichen\nZeilenumbrüchen\nNew line"
+        expected = wrap_with_gmail_template(
+            convert_newlines_to_html(remove_artificial_line_breaks(text))
+        )
+
+        assert prepare_email_body(text) == expected
+
+    def test_does_not_rewrap_existing_html(self):
+        """Test that content with HTML structure is returned unwrapped."""
+        text = '<div style="color: red;">Hi</div>'
+
+        assert prepare_email_body(text) == text
+
+    def test_plain_text_skips_html_detection(self):
+        """Test that plain_text=True always wraps in the template."""
+        text = '<div style="color: red;">Hi</div>'
+
+        assert prepare_email_body(text, plain_text=True) == (
+            '<div style="font-family: sans-serif;"><div style="color: red;">Hi</div></div>'
+        )
@@ -0,0 +1,71 @@
+"""
+Unit tests for Gmail tool helper functions.
+
+SECURITY NOTE:
+- All test data uses generic @test.example.com addresses
+- No real personal data or credentials
+- Tests are fully isolated and make no API calls
+"""
+
+from gmail.gmail_tools import _extract_headers
+
+
+class TestExtractHeaders:
+    """Tests for _extract_headers function."""
+
+    def test_matches_header_names_case_insensitively(self):
+        """Test that header names are matched regardless of case."""
+        payload = {
+            "headers": [
+                {"name": "SUBJECT", "value": "Test Subject"},
+                {"name": "message-id", "value": "<test-msg-001@mail.test.example.com>"},
+            ]
+        }
+        result = _extract_headers(payload, ["Subject", "Message-ID"])
+
+        assert result == {
+            "Subject": "Test Subject",
+            "Message-ID": "<test-msg-001@mail.test.example.com>",
+        }
+
+    def test_keeps_requested_casing(self):
+        """Test that results are keyed by the caller's casing, not the message's."""
+        payload = {"headers": [{"name": "From", "value": "sender@test.example.com"}]}
+        result = _extract_headers(payload, ["fRoM"])
+
+        assert result == {"fRoM": "sender@test.example.com"}
+
+    def test_last_duplicate_wins(self):
+        """Test that the last occurrence of a repeated header wins."""
+        payload = {
+            "headers": [
+                {"name": "Subject", "value": "First"},
+                {"name": "subject", "value": "Second"},
+            ]
+        }
+        result = _extract_headers(payload, ["Subject"])
+
+        assert result == {"Subject": "Second"}
+
+    def test_omits_missing_headers(self):
+        """Test that requested headers absent from the payload are not included."""
+        payload = {"headers": [{"name": "To", "value": "recipient@test.example.com"}]}
+        result = _extract_headers(payload, ["To", "Cc", "Subject"])
+
+        assert result == {"To": "recipient@test.example.com"}
+
+    def test_ignores_unrequested_headers(self):
+        """Test that headers not asked for are not returned."""
+        payload = {
+            "headers": [
+                {"name": "To", "value": "recipient@test.example.com"},
+                {"name": "X-Custom", "value": "ignored"},
+            ]
+        }
+        result = _extract_headers(payload, ["To"])
+
+        assert result == {"To": "recipient@test.example.com"}
+
+    def test_handles_payload_without_headers(self):
+        """Test that a payload with no headers yields an empty dict."""
+        assert _extract_headers({}, ["Subject"]) == {}